@@ -431,7 +431,7 @@ class Graphics:
             self._save_image(year)
             self.save_to_file(year, n_species) if self._log_file is not None else None
         else:
-            canvas.draw()
+            canvas.draw_idle()
             QApplication.processEvents()
 
             loop = QEventLoop()
@@ -486,15 +486,24 @@ class Graphics:
         else:
             raise ValueError(f'Unknown movie format: {movie_fmt}')
 
-    def reset_counts(self):
-        """Resets the animal count plot."""
-        try:
-            self._line_ax.remove()
-        except AttributeError:
+    def reset_data(self, final_year):
+        """
+        Resets the animal count plot in place, keeping its axis.
+
+        Parameters
+        ----------
+        final_year : int
+        """
+        if self._line_ax is None:
             return
-        # self._line_ax2.remove()
-        self._line_ax = None
-        # self._line_ax2 = None
+
+        self.final_year = final_year
+        self.herbs = np.arange(0, final_year+1, self.vis_years)
+        self.carns = np.arange(0, final_year+1, self.vis_years)
+        self.n_herbs.set_data(self.herbs, np.full_like(self.herbs, np.nan, dtype=float))
+        self.n_carns.set_data(self.carns, np.full_like(self.carns, np.nan, dtype=float))
+        self._line_ax.set_xlim(0, final_year)
+        self._line_ax.set_ylim(0, self.ymax_animals if self.ymax_animals else 1)
 
     def reset_graphics(self):
         """Resets the graphics."""
@@ -692,19 +701,24 @@ class Graphics:
         """
         herbs = animals["Herbivore"]
         carns = animals["Carnivore"]
+        n_herbs = len(herbs)
+        n_carns = len(carns)
 
-        herbivores_age = [herb.a for herb in herbs]
-        carnivores_age = [carn.a for carn in carns]
+        # The features are gathered into arrays once, and used for both histograms and means.
+        herbivores_age = np.fromiter((herb.a for herb in herbs), dtype=float, count=n_herbs)
+        carnivores_age = np.fromiter((carn.a for carn in carns), dtype=float, count=n_carns)
         herbs_age, _ = np.histogram(herbivores_age, bins=self.age_bins)
         carns_age, _ = np.histogram(carnivores_age, bins=self.age_bins)
 
-        herbivores_weight = [herb.w for herb in herbs]
-        carnivores_weight = [carn.w for carn in carns]
+        herbivores_weight = np.fromiter((herb.w for herb in herbs), dtype=float, count=n_herbs)
+        carnivores_weight = np.fromiter((carn.w for carn in carns), dtype=float, count=n_carns)
         herbs_weight, _ = np.histogram(herbivores_weight, bins=self.weight_bins)
         carns_weight, _ = np.histogram(carnivores_weight, bins=self.weight_bins)
 
-        herbivores_fitness = [herb.fitness for herb in herbs]
-        carnivores_fitness = [carn.fitness for carn in carns]
+        herbivores_fitness = np.fromiter((herb.fitness for herb in herbs),
+                                         dtype=float, count=n_herbs)
+        carnivores_fitness = np.fromiter((carn.fitness for carn in carns),
+                                         dtype=float, count=n_carns)
         herbs_fitness, _ = np.histogram(herbivores_fitness, bins=self.fitness_bins)
         carns_fitness, _ = np.histogram(carnivores_fitness, bins=self.fitness_bins)
 
@@ -723,17 +737,15 @@ class Graphics:
         self._weight_ax.set_ylim([-_weight_ylim*0.03, _weight_ylim])
         self._fitness_ax.set_ylim([-_fitness_ylim*0.03, _fitness_ylim])
 
-        n_herbs = len(herbs)
-        n_carns = len(carns)
         return {"Herbivore": {
-                     "Age": sum(herbivores_age) / n_herbs if n_herbs > 0 else np.nan,
-                     "Weight": sum(herbivores_weight) / n_herbs if n_herbs > 0 else np.nan,
-                     "Fitness": sum(herbivores_fitness) / n_herbs if n_herbs > 0 else np.nan
+                     "Age": herbivores_age.mean() if n_herbs > 0 else np.nan,
+                     "Weight": herbivores_weight.mean() if n_herbs > 0 else np.nan,
+                     "Fitness": herbivores_fitness.mean() if n_herbs > 0 else np.nan
                 },
                 "Carnivore": {
-                    "Age": sum(carnivores_age) / n_carns if n_carns > 0 else np.nan,
-                    "Weight": sum(carnivores_weight) / n_carns if n_carns > 0 else np.nan,
-                    "Fitness": sum(carnivores_fitness) / n_carns if n_carns > 0 else np.nan}
+                    "Age": carnivores_age.mean() if n_carns > 0 else np.nan,
+                    "Weight": carnivores_weight.mean() if n_carns > 0 else np.nan,
+                    "Fitness": carnivores_fitness.mean() if n_carns > 0 else np.nan}
                 }
 
     def save_to_file(self, year, data):
@@ -10,26 +10,32 @@ Released under the MIT License, see included LICENSE file.
 import sys
 import time
 import math
+import numpy as np
 from perlin_noise import PerlinNoise
-from PyQt5.QtCore import Qt, QRect, QRectF, QMimeData, QSize
-from PyQt5.QtGui import QPainter, QPen, QBrush, QColor, QDrag, QPixmap, QIcon
+from PyQt5.QtCore import (Qt, QRect, QMimeData, QSize, QTimer, QObject, QRunnable,
+                          QThreadPool, pyqtSignal)
+from PyQt5.QtGui import QPainter, QBrush, QColor, QDrag, QPixmap, QIcon, QImage
 from PyQt5.QtWidgets import (QMainWindow, QTabWidget, QApplication, QWidget, QHBoxLayout,
                              QVBoxLayout, QGroupBox, QGridLayout, QLabel, QPushButton, QSlider,
                              QGraphicsView, QGraphicsScene, QMessageBox, QGraphicsPixmapItem,
                              QInputDialog, QScrollArea)
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-import matplotlib.pyplot as plt
 
-from .simulation import BioSim
 from .animals import Herbivore, Carnivore
 
-VARIABLE = {"island": ["W" * 21 for _ in range(21)],
+# Matplotlib, and the simulation which imports it, are imported where first needed, as they take
+# up most of the start-up time and are not needed until the simulation is built.
+
+# The island is stored as a 2D array of the terrain letters' character codes.
+_WATER = ord("W")
+
+VARIABLE = {"island": np.full((21, 21), _WATER, dtype=np.uint8),
             "perlin": {"octaves": 4,            # Density of land (higher = more 'islands').
                        "lower": -0.23,          # Water < 'lower'.
                        "middle": 0.0,           # 'lower' < Lowland < 'middle'.
                        "upper": 0.2},           # 'middle' < Highland < 'upper'. Otherwise Mountain.
             "selected": {"pos": (int, int), "species": str, "amount": int},
             "biosim": None,
+            "island_dirty": False,
             "speed": 1e-7,
             "colours": {"W": "#95CBCC",
                         "H": "#E8EC9E",
@@ -38,6 +44,145 @@ VARIABLE = {"island": ["W" * 21 for _ in range(21)],
             "modified": {},
             "dir": str(sys._MEIPASS) if getattr(sys, 'frozen', False) else "src/biosim/_static"}
 
+_HERBIVORE_COLOUR = (0.71764, 0.749, 0.63137)
+_CARNIVORE_COLOUR = (0.949, 0.7647, 0.56078)
+
+# Years simulated per run, which also sets the span of the history's x-axis.
+_SIMULATION_YEARS = 1000
+
+# The species' images and the button icons, loaded once (see `_species_pixmap` and `_icon`).
+_SPECIES_PIXMAPS = {}
+_ICONS = {}
+
+
+def _lttb(x, y, n_out):
+    """
+    Downsample a series with the Largest-Triangle-Three-Buckets algorithm.
+
+    Parameters
+    ----------
+    x : np.ndarray
+    y : np.ndarray
+    n_out : int
+        Number of points to keep.
+
+    Returns
+    -------
+    x : np.ndarray
+    y : np.ndarray
+
+    Notes
+    -----
+    The first and last points are always kept. The points in between are split into
+    n_out - 2 buckets, and from each bucket the point forming the largest triangle with the
+    previously selected point and the average of the next bucket is kept.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return x, y
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    selected = np.empty(n_out, dtype=int)
+    selected[0] = 0
+    selected[-1] = n - 1
+
+    previous = 0
+    for k in range(n_out - 2):
+        start, end = edges[k], edges[k + 1]
+        following = edges[k + 2] if k + 2 < len(edges) else n
+        avg_x = x[end:following].mean()
+        avg_y = y[end:following].mean()
+
+        areas = np.abs((x[previous] - avg_x) * (y[start:end] - y[previous]) -
+                       (x[previous] - x[start:end]) * (avg_y - y[previous]))
+        previous = start + int(np.nan_to_num(areas, nan=-1.0).argmax())
+        selected[k + 1] = previous
+
+    return x[selected], y[selected]
+
+
+def _perlin(noise, x, y):
+    """
+    Evaluate two-dimensional Perlin noise for arrays of coordinates at once.
+
+    Parameters
+    ----------
+    noise : PerlinNoise
+    x : np.ndarray
+    y : np.ndarray
+
+    Returns
+    -------
+    np.ndarray
+        The same values as calling `noise((x, y))` for each pair of coordinates.
+
+    Notes
+    -----
+    Only the gradient vectors of the lattice corners are looked up through `noise`, once per
+    corner. The interpolation between them is done for all coordinates in one go.
+
+    This relies on internals of perlin_noise (`get_from_cache_of_create_new` and `.vec`), which
+    is therefore pinned to the tested version in setup.cfg.
+    """
+    x = np.asarray(x, dtype=float) * noise.octaves
+    y = np.asarray(y, dtype=float) * noise.octaves
+    if not x.size:
+        return x
+
+    x_low = np.floor(x).astype(int)
+    y_low = np.floor(y).astype(int)
+    x_min, y_min = x_low.min(), y_low.min()
+    gradients = np.array([[noise.get_from_cache_of_create_new((int(a), int(b))).vec
+                           for b in range(y_min, y_low.max() + 2)]
+                          for a in range(x_min, x_low.max() + 2)])
+
+    def fade(t):
+        return t * t * t * (t * (6 * t - 15) + 10)
+
+    values = np.zeros_like(x)
+    for a in (x_low, x_low + 1):
+        for b in (y_low, y_low + 1):
+            dx, dy = x - a, y - b
+            gradient = gradients[a - x_min, b - y_min]
+            values += (fade(1 - np.abs(dx)) * fade(1 - np.abs(dy)) *
+                       (gradient[..., 0] * dx + gradient[..., 1] * dy))
+    return values
+
+
+def _species_pixmap(species):
+    """
+    The image of a species, loaded from disk the first time it is requested.
+
+    Parameters
+    ----------
+    species : str
+
+    Returns
+    -------
+    QPixmap
+    """
+    if species not in _SPECIES_PIXMAPS:
+        _SPECIES_PIXMAPS[species] = QPixmap(VARIABLE["dir"] + f"/{species}.png")
+    return _SPECIES_PIXMAPS[species]
+
+
+def _icon(name):
+    """
+    A button icon, loaded from disk the first time it is requested.
+
+    Parameters
+    ----------
+    name : str
+        File name of the icon, without the extension.
+
+    Returns
+    -------
+    QIcon
+    """
+    if name not in _ICONS:
+        _ICONS[name] = QIcon(VARIABLE["dir"] + f"/{name}.png")
+    return _ICONS[name]
+
 
 class BioSimGUI:
     """Class for the graphical user interface."""
@@ -115,67 +260,48 @@ class BioSimGUI:
     def shrink(island):
         """
         Shrink the edges of the island to the minimum possible border (if not all cells are water).
-        This is done by first transposing the island, then removing the top and bottom rows if they
-        are only water, and finally transposing the island back to its original orientation and
-        doing the same steps again. The island is then expanded to a square by adding water to
-        the top and bottom or left and right an equal amount of times at each side until it is a
-        square.
+        This is done by removing the rows and columns that are only water, keeping a single one
+        of them on each side of the land. The island is then expanded to a square by adding water
+        to the top and bottom or left and right an equal amount of times at each side until it
+        is a square.
 
         Parameters
         ----------
-        island : list
+        island : np.ndarray
 
         Returns
         -------
-        island : list
+        island : np.ndarray
+            A contiguous array.
         """
-        if all(cell == "W" for row in island for cell in row):
+        land = island != _WATER
+        if not land.any():
             return island
-        for _ in range(2):
-            # Since transposing is done twice, it will be back to its original when returned.
-            island = [''.join(row) for row in zip(*island)]
-
-            # Remove top row(s) if it is only water.
-            i = 0
-            while (all(cell == "W" for cell in island[i]) and
-                   all(cell == "W" for cell in island[i+1])):
-                island = island[1:]
-
-            # Remove bottom row(s) if it is only water.
-            j = len(island) - 1
-            while (all(cell == "W" for cell in island[j]) and
-                   all(cell == "W" for cell in island[j-1])):
-                island = island[:-1]
-                j -= 1
-
-        rows = len(island)
-        cols = len(island[0])
+
+        rows = np.flatnonzero(land.any(axis=1))
+        cols = np.flatnonzero(land.any(axis=0))
+        island = island[max(rows[0] - 1, 0):rows[-1] + 2, max(cols[0] - 1, 0):cols[-1] + 2]
+
+        # Water is added alternately to either side, starting at the top (or right).
+        rows, cols = island.shape
+        first, second = (abs(rows - cols) + 1) // 2, abs(rows - cols) // 2
         if rows < cols:
-            i = 1
-            while rows < cols:
-                if i % 2 == 0:
-                    island.append("W" * cols)
-                else:
-                    island = ["W" * cols] + island
-                i += 1
-                rows += 1
+            island = np.pad(island, ((first, second), (0, 0)), constant_values=_WATER)
         elif cols < rows:
-            j = 1
-            while cols < rows:
-                if j % 2 == 0:
-                    island = ["W" + row for row in island]
-                else:
-                    island = [row + "W" for row in island]
-                j += 1
-                cols += 1
+            island = np.pad(island, ((0, 0), (second, first)), constant_values=_WATER)
 
-        return island
+        # An already square crop is a view into the given island, so it is copied.
+        return np.ascontiguousarray(island)
 
     @staticmethod
     def restart():
         """Restart the simulation."""
+        from .simulation import BioSim
+
         VARIABLE["island"] = BioSimGUI.shrink(VARIABLE["island"])
-        geogr = "\n".join(VARIABLE["island"])
+        # The rows are ended by a column of newlines, so that the map is decoded in one go.
+        geogr = np.pad(VARIABLE["island"], ((0, 0), (0, 1)),
+                       constant_values=ord("\n")).tobytes().decode()[:-1]
         try:
             VARIABLE["biosim"].graphics.reset_graphics()
         except (AttributeError, KeyError):
@@ -206,65 +332,64 @@ class Main(QMainWindow):
         information = Information()
         self.tabs.addTab(information, "Informasjon")
 
-        # Draw:
-        draw_widget = QWidget()
-        draw_layout = QVBoxLayout()
-        draw_widget.setLayout(draw_layout)
-
-        self.draw = Draw()
-        draw_layout.addWidget(self.draw)
-        self.tabs.addTab(self.draw, 'Tegn')
-
-        # Populate:
-        populate_widget = QWidget()
-        populate_layout = QVBoxLayout()
-        populate_widget.setLayout(populate_layout)
-
-        self.populate = Populate()
-        populate_layout.addWidget(self.populate)
-        self.tabs.addTab(self.populate, 'Befolk')
-
-        # Simulate:
-        simulate_widget = QWidget()
-        simulate_layout = QVBoxLayout()
-        simulate_widget.setLayout(simulate_layout)
-
-        self.simulate = Simulate()
-        simulate_layout.addWidget(self.simulate)
-        self.tabs.addTab(self.simulate, 'Simuler')
-
-        # History:
-        history_widget = QWidget()
-        history_layout = QVBoxLayout()
-        history_widget.setLayout(history_layout)
-
-        self.history = History()
-        history_layout.addWidget(self.history)
-        self.tabs.addTab(self.history, 'Historie')
+        # The remaining tabs are built when first shown (see `build`).
+        self.draw = None
+        self.populate = None
+        self.simulate = None
+        self.history = None
+        for name in ('Tegn', 'Befolk', 'Simuler', 'Historie'):
+            page = QWidget()
+            page.setLayout(QVBoxLayout())
+            page.layout().setContentsMargins(0, 0, 0, 0)
+            self.tabs.addTab(page, name)
 
         self.previous = 0
         self.tabs.currentChanged.connect(self.change)
         self.tabs.setCurrentIndex(0)
 
+    def build(self, index):
+        """
+        Build the contents of a tab, if not already built.
+
+        Parameters
+        ----------
+        index : int
+        """
+        if index == 1 and self.draw is None:
+            self.draw = widget = Draw()
+        elif index == 2 and self.populate is None:
+            self.populate = widget = Populate()
+        elif index == 3 and self.simulate is None:
+            self.simulate = widget = Simulate()
+        elif index == 4 and self.history is None:
+            self.history = widget = History()
+        else:
+            return
+        self.tabs.widget(index).layout().addWidget(widget)
+
     def change(self, index):
         """Switching to new tabs executes the following."""
+        self.build(index)
+
         if self.previous == 1 and index != 1:
-            # Switching from draw page.
-            BioSimGUI.restart()
-            try:
-                self.populate.plot.update()
-            except AttributeError:
-                pass
+            # Switching from draw page. Only rebuild the simulation if the island was modified.
+            if VARIABLE["island_dirty"] or VARIABLE["biosim"] is None:
+                BioSimGUI.restart()
+                VARIABLE["island_dirty"] = False
+                try:
+                    self.populate.plot.update()
+                except AttributeError:
+                    pass
         elif self.previous == 3 and index != 3:
             # Switching from simulate page.
             self.simulate.stop()
-            self.history.update()
+            self.history.update() if self.history else None
 
         self.previous = index
 
         if index == 1:
             # Switching to draw page.
-            if any(cell != "W" for row in VARIABLE["island"] for cell in row):
+            if (VARIABLE["island"] != _WATER).any():
                 msg_box = QMessageBox()
                 msg_box.setIcon(QMessageBox.Warning)
                 msg_box.setText(
@@ -277,7 +402,8 @@ class Main(QMainWindow):
                     self.tabs.setCurrentIndex(self.previous)
                     return
 
-                self.simulate.reset()
+                VARIABLE["island_dirty"] = True
+                self.simulate.reset() if self.simulate else None
                 VARIABLE["modified"].clear()
                 VARIABLE["biosim"].reset_history() if VARIABLE["biosim"] else None
             self.draw.plot.update()
@@ -475,7 +601,9 @@ class Draw(QWidget):
         self.plot.setGeometry(QRect(0, 0, 800, 800))
         self.layout.addWidget(self.plot)
 
-        self.selection = []
+        # The terrain buttons with their idle and selected stylesheets, by button letter.
+        self.selection = {}
+        self._selected = None
 
         self.buttons()
         self.plot.update()
@@ -495,25 +623,25 @@ class Draw(QWidget):
 
         bigger_button = QPushButton()
         bigger_button.setFixedSize(size, size)
-        bigger_button.setIcon(QIcon(VARIABLE["dir"] + "/zoom-out.png"))
+        bigger_button.setIcon(_icon("zoom-out"))
         bigger_button.setIconSize(QSize(size//3, size//3))
         bigger_button.clicked.connect(self.bigger)
 
         smaller_button = QPushButton()
         smaller_button.setFixedSize(size, size)
-        smaller_button.setIcon(QIcon(VARIABLE["dir"] + "/zoom-in.png"))
+        smaller_button.setIcon(_icon("zoom-in"))
         smaller_button.setIconSize(QSize(size//3, size//3))
         smaller_button.clicked.connect(self.smaller)
 
         autocomplete_button = QPushButton()
         autocomplete_button.setFixedSize(size, size)
-        autocomplete_button.setIcon(QIcon(VARIABLE["dir"] + "/stars.png"))
+        autocomplete_button.setIcon(_icon("stars"))
         autocomplete_button.setIconSize(QSize(size // 2, size // 2))
         autocomplete_button.clicked.connect(self.autocomplete)
 
         clear_button = QPushButton()
         clear_button.setFixedSize(size, size)
-        clear_button.setIcon(QIcon(VARIABLE["dir"] + "/delete.png"))
+        clear_button.setIcon(_icon("delete"))
         clear_button.setIconSize(QSize(size // 3, size // 3))
         clear_button.clicked.connect(self.clear)
 
@@ -534,7 +662,9 @@ class Draw(QWidget):
             button.setStyleSheet(f"background-color: {color};")
             button.clicked.connect(lambda _, name=_name: self.color_clicked(name))
             terrain_buttons[_name] = button
-            self.selection.append(button)
+            self.selection[_name] = (button,
+                                     f"background-color: {color};",
+                                     f"background-color: {color}; border: 3px solid black")
 
         terrain_layout.addWidget(terrain_buttons["V"], 0, 0)
         terrain_layout.addWidget(terrain_buttons["H"], 0, 1)
@@ -557,7 +687,8 @@ class Draw(QWidget):
 
     def color_clicked(self, name):
         """
-        Change the selected terrain type.
+        Change the selected terrain type. Only the previously and newly selected buttons are
+        restyled.
 
         Parameters
         ----------
@@ -565,58 +696,44 @@ class Draw(QWidget):
         """
         mapping = {"V": "W", "H": "H", "L": "L", "F": "M"}
         self.plot.terrain = mapping[name[0]]
-        for button in self.selection:
-            if button.text()[0] == name:
-                button.setStyleSheet(
-                    f"background-color: {VARIABLE['colours'][mapping[name[0]]]}; "
-                    f"border: 3px solid black"
-                )
-            else:
-                button.setStyleSheet(
-                    f"background-color: {VARIABLE['colours'][mapping[button.text()[0]]]};"
-                )
+        if name == self._selected:
+            return
+
+        if self._selected is not None:
+            button, idle, _ = self.selection[self._selected]
+            button.setStyleSheet(idle)
+        button, _, selected = self.selection[name]
+        button.setStyleSheet(selected)
+        self._selected = name
 
     def bigger(self):
         """Increase the size of the map."""
-        if len(VARIABLE["island"][0]) >= 44:
+        if VARIABLE["island"].shape[1] >= 44:
             return
 
-        new = ["W" * (len(VARIABLE["island"][0]) + 2)]
-        for row in VARIABLE["island"]:
-            _row = "W" + row + "W"
-            new.append(_row)
-        new.append("W" * (len(VARIABLE["island"][0]) + 2))
-
-        VARIABLE["island"] = new
+        VARIABLE["island"] = np.pad(VARIABLE["island"], 1, constant_values=_WATER)
+        VARIABLE["island_dirty"] = True
         self.plot.update()
 
     def smaller(self):
         """Decrease the size of the map."""
-        if len(VARIABLE["island"][0]) <= 4:
+        if VARIABLE["island"].shape[1] <= 4:
             return
 
-        new = ["W" * (len(VARIABLE["island"][0]) - 2)]
-        for row in VARIABLE["island"][2:-2]:
-            _row = "W" + row[2:-2] + "W"
-            new.append(_row)
-        new.append("W" * (len(VARIABLE["island"][0]) - 2))
-
-        VARIABLE["island"] = new
+        # The two outermost rings are dropped, and a ring of water is added in their stead.
+        VARIABLE["island"] = np.pad(VARIABLE["island"][2:-2, 2:-2], 1, constant_values=_WATER)
+        VARIABLE["island_dirty"] = True
         self.plot.update()
 
     @staticmethod
     def center():
         """Computes the dynamic center based on user's drawings."""
-        drawn = [(i, j) for i, row in enumerate(VARIABLE["island"])
-                 for j, cell in enumerate(row) if cell != "W"]
+        i, j = np.nonzero(VARIABLE["island"] != _WATER)
 
-        if not drawn:
+        if not i.size:
             return len(VARIABLE["island"]) // 2, len(VARIABLE["island"][0]) // 2
 
-        avg_i = sum(i for i, _ in drawn) / len(drawn)
-        avg_j = sum(j for _, j in drawn) / len(drawn)
-
-        return int(avg_i), int(avg_j)
+        return int(i.mean()), int(j.mean())
 
     def autocomplete(self):
         """
@@ -631,37 +748,29 @@ class Draw(QWidget):
         size = len(VARIABLE["island"])
         center_i, center_j = self.center()
 
+        inner = VARIABLE["island"][1:-1, 1:-1]
+        water = inner == _WATER
+        i, j = np.nonzero(water)
+        i += 1
+        j += 1
+
+        # Perlin noice based on distance from the center of the map (or drawn cells).
         noise = PerlinNoise(octaves=VARIABLE["perlin"]["octaves"])
-        for i in range(1, size - 1):
-            for j in range(1, size - 1):
-
-                if VARIABLE["island"][i][j] != "W":
-                    continue
-
-                # Perlin noice based on distance from the center of the map (or drawn cells).
-                distance = (math.sqrt((i - center_i) ** 2 + (j - center_j) ** 2) /
-                            math.sqrt(2 * size ** 2))
-                perlin = noise([i / size, j / size]) - distance
-
-                if perlin < VARIABLE["perlin"]["lower"]:
-                    terrain = "W"
-                elif VARIABLE["perlin"]["lower"] <= perlin < VARIABLE["perlin"]["middle"]:
-                    terrain = "L"
-                elif VARIABLE["perlin"]["middle"] <= perlin < VARIABLE["perlin"]["upper"]:
-                    terrain = "H"
-                else:
-                    terrain = "M"
-
-                VARIABLE["island"][i] = (VARIABLE["island"][i][:j] +
-                                         terrain +
-                                         VARIABLE["island"][i][j + 1:])
+        perlin = _perlin(noise, i / size, j / size)
+        perlin -= np.hypot(i - center_i, j - center_j) / math.sqrt(2 * size ** 2)
+
+        thresholds = (VARIABLE["perlin"]["lower"],
+                      VARIABLE["perlin"]["middle"],
+                      VARIABLE["perlin"]["upper"])
+        inner[water] = np.frombuffer(b"WLHM", dtype=np.uint8)[np.digitize(perlin, thresholds)]
 
+        VARIABLE["island_dirty"] = True
         self.plot.update()
 
     def clear(self):
         """Clear the map."""
-        VARIABLE["island"] = ["W" * len(VARIABLE["island"][0])
-                              for _ in range(len(VARIABLE["island"]))]
+        VARIABLE["island"] = np.full_like(VARIABLE["island"], _WATER)
+        VARIABLE["island_dirty"] = True
         self.plot.update()
 
 
@@ -681,8 +790,38 @@ class Map(QGraphicsView):
 
         self.terrain = terrain
         self.drawing = drawing
+        # Size of a cell in scene units. Set so that the island spans roughly 800 units.
         self.size = 100
 
+        # Last painted (i, j, terrain), so that repeated move events within a cell are skipped.
+        self._last_paint_cell = (-1, -1, None)
+
+        # Pixel values (0xAARRGGBB) indexed by the terrain letters' character codes, as stored in
+        # the island, so that the island is translated to pixels with a single lookup.
+        self._lut = np.zeros(256, dtype=np.uint32)
+        for terrain, colour in VARIABLE["colours"].items():
+            self._lut[ord(terrain)] = QColor(colour).rgb()
+
+        # The cells are written as single pixels into an array, shown scaled as one scene item.
+        # The item is only recreated when the island's shape changes.
+        self._pixels = np.empty((0, 0), dtype=np.uint32)
+        self.island = None
+
+        # The animals placed on the map.
+        self.pixmap_items = []
+
+        # The island as last painted, so that unchanged islands are not repainted.
+        self._painted = None
+
+        # Updates while hidden are deferred until the map is shown.
+        self._needs_update = False
+
+        # Showing the painted pixmap and fitting it to the view is done at most once per frame.
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(16)
+        self._refresh_timer.timeout.connect(self._refresh)
+
         self.scene = QGraphicsScene(self)
         self.scene.setBackgroundBrush(QBrush(QColor(VARIABLE['colours']["W"])))
         self.setScene(self.scene)
@@ -696,29 +835,114 @@ class Map(QGraphicsView):
             self.setAcceptDrops(True)
 
     def update(self):
-        """Update the scene."""
+        """
+        Update the scene. The island item is only recreated if the island's shape has changed,
+        otherwise the placed animals are removed. Only the cells that have changed since they
+        were last painted are repainted. Deferred until shown if the map is hidden.
+        """
+        if not self.isVisible():
+            self._needs_update = True
+            return
+        self._needs_update = False
+
+        rows, cols = VARIABLE["island"].shape
+        rebuilt = self.island is None or self._pixels.shape != (rows, cols)
+        if rebuilt:
+            self.rebuild()
+        else:
+            self.remove_animals()
+
+        changed = VARIABLE["island"] != self._painted
+        if not changed.any():
+            # A rebuilt island still has to be fitted to the view.
+            self._schedule() if rebuilt else None
+            return
+
+        self._pixels[changed] = self._lut[VARIABLE["island"][changed]]
+        self._painted = VARIABLE["island"].copy()
+        self._schedule()
+
+    def rebuild(self):
+        """Recreate the island item of the scene."""
         self.scene.clear()
-        pen = QPen(Qt.NoPen)
-        for j, row in enumerate(VARIABLE["island"]):
-            for i, cell in enumerate(row):
-                brush = QBrush(QColor(VARIABLE['colours'][cell]))
-                rect = QRectF(i * self.size, j * self.size, self.size, self.size)
-                self.scene.addRect(rect, pen, brush)
-        self.scene.setSceneRect(self.scene.itemsBoundingRect())
+        self.pixmap_items.clear()
+        rows, cols = VARIABLE["island"].shape
+        self.size = max(8, 800 // cols)
+        self._pixels = np.full((rows, cols), self._lut[_WATER], dtype=np.uint32)
+        self._painted = np.full((rows, cols), _WATER, dtype=np.uint8)
+        self.island = self.scene.addPixmap(self._pixmap())
+        self.island.setScale(self.size)
+        self.island.setZValue(-1)
+        self.scene.setSceneRect(self.island.sceneBoundingRect())
+
+    def set_cell(self, i, j, terrain):
+        """
+        Set the terrain of a single cell.
+
+        Parameters
+        ----------
+        i : int
+            Column of the cell.
+        j : int
+            Row of the cell.
+        terrain : str
+        """
+        self._painted[j, i] = ord(terrain)
+        self._pixels[j, i] = self._lut[ord(terrain)]
+        self._schedule()
+
+    def remove_animals(self):
+        """Remove the placed animals from the scene."""
+        for item in self.pixmap_items:
+            self.scene.removeItem(item)
+        self.pixmap_items.clear()
+
+    def _schedule(self):
+        """Schedule a refresh of the view, unless one is pending already."""
+        if not self._refresh_timer.isActive():
+            self._refresh_timer.start()
+
+    def _pixmap(self):
+        """
+        The painted pixels as a pixmap.
+
+        Returns
+        -------
+        QPixmap
+        """
+        rows, cols = self._pixels.shape
+        # The image wraps the temporary bytes, so it is copied before they are released.
+        image = QImage(self._pixels.tobytes(), cols, rows, 4 * cols, QImage.Format_RGB32).copy()
+        return QPixmap.fromImage(image)
+
+    def _refresh(self):
+        """Show the painted pixels, and fit the island to the view."""
+        self.island.setPixmap(self._pixmap())
         self.fitInView(self.scene.sceneRect(), Qt.KeepAspectRatio)
 
+    def showEvent(self, event):
+        """Executed when the map is shown. Performs updates deferred while hidden."""
+        super().showEvent(event)
+        if self._needs_update:
+            self.update()
+
     def resizeEvent(self, event):
         """Resizes the plot to fit within the scene."""
         self.fitInView(self.scene.sceneRect(), Qt.KeepAspectRatio)
 
     def mousePressEvent(self, event):
         """Executed when the mouse is pressed."""
+        self._last_paint_cell = (-1, -1, None)
         if self.drawing:
             self.mouseMoveEvent(event)
             return
 
         self.dropEvent(event)
 
+    def mouseReleaseEvent(self, event):
+        """Executed when the mouse is released."""
+        self._last_paint_cell = (-1, -1, None)
+
     def dragEnterEvent(self, event):
         if event.mimeData().hasText():
             event.acceptProposedAction()
@@ -747,20 +971,21 @@ class Map(QGraphicsView):
         i = int(position.x() // self.size)
         j = int(position.y() // self.size)
 
-        if VARIABLE["island"][j][i] == "W":
+        if VARIABLE["island"][j, i] == _WATER:
             msg = QMessageBox()
             msg.setText("Dyr kan ikke plasseres i vann.")
             msg.exec_()
             return
 
         try:
-            image = QPixmap(VARIABLE["dir"] + f"/{species}.png").scaled(self.size, self.size)
+            image = _species_pixmap(species).scaled(self.size, self.size)
         except TypeError:
             return
 
         item = QGraphicsPixmapItem(image)
         item.setPos(i * self.size, j * self.size)
         self.scene.addItem(item)
+        self.pixmap_items.append(item)
 
         num_animals, ok = QInputDialog.getInt(self, "Antall dyr", "Hvor mange?", 1, 1, 1000)
         if ok:
@@ -772,6 +997,7 @@ class Map(QGraphicsView):
             Populate.populate()
         else:
             self.scene.removeItem(item)
+            self.pixmap_items.remove(item)
 
     def mouseMoveEvent(self, event):
         """Executed when the mouse is pressed-moved."""
@@ -780,17 +1006,18 @@ class Map(QGraphicsView):
             i = int(position.x() // self.size)
             j = int(position.y() // self.size)
 
-            if 0 < i < len(VARIABLE["island"][0])-1 and 0 < j < len(VARIABLE["island"])-1:
-                VARIABLE["island"][j] = (VARIABLE["island"][j][:i] +
-                                         self.terrain +
-                                         VARIABLE["island"][j][i + 1:])
+            if (i, j, self.terrain) == self._last_paint_cell:
+                return
+            self._last_paint_cell = (i, j, self.terrain)
 
-                pen = QPen(Qt.NoPen)
-                self.scene.addRect(
-                    i * self.size, j * self.size,
-                    self.size, self.size,
-                    pen, QBrush(QColor(VARIABLE['colours'][self.terrain]))
-                )
+            rows, cols = VARIABLE["island"].shape
+            # Cells already of the selected terrain are left as they are.
+            if (0 < i < cols - 1 and 0 < j < rows - 1 and
+                    VARIABLE["island"][j, i] != ord(self.terrain)):
+                VARIABLE["island"][j, i] = ord(self.terrain)
+                VARIABLE["island_dirty"] = True
+
+                self.set_cell(i, j, self.terrain)
 
 
 class Species(QLabel):
@@ -805,12 +1032,38 @@ class Species(QLabel):
     """
     selected = None
 
+    _STYLE_IDLE = """
+        QLabel {
+            background-color: transparent;
+        }
+        QLabel::hover {
+            background-color: transparent; 
+            border: 2px solid black;
+            border-radius: 4px;
+        }
+    """
+    _STYLE_SELECTED = """
+        QLabel {
+            background-color: transparent; 
+            border: 2px solid black;
+            border-radius: 4px;
+        }
+    """
+
     def __init__(self, pixmap, species):
         super().__init__()
 
         self.pixmap = pixmap
 
-        self.setPixmap(pixmap.scaled(QSize(200, 200), Qt.KeepAspectRatio))
+        # What is dragged onto the map, created once rather than on every drag.
+        self._drag_pixmap = pixmap.scaled(QSize(100, 100), Qt.KeepAspectRatio,
+                                          Qt.FastTransformation)
+        self._drag_image = pixmap.toImage()
+
+        # The label is only scaled once, so it can afford smooth scaling.
+        self._label_pixmap = pixmap.scaled(QSize(200, 200), Qt.KeepAspectRatio,
+                                           Qt.SmoothTransformation)
+        self.setPixmap(self._label_pixmap)
         self.setFixedSize(180, 180)
         self.setScaledContents(True)
         self.setAcceptDrops(True)
@@ -819,55 +1072,47 @@ class Species(QLabel):
         self.size = 10
         self.species = species
 
+    def _start_drag(self):
+        """
+        Drag the species.
+
+        Notes
+        -----
+        The drag takes ownership of its mime data, so it cannot be reused between drags.
+        """
+        drag = QDrag(self)
+        mime_data = QMimeData()
+        mime_data.setText(self.species)
+        mime_data.setImageData(self._drag_image)
+        drag.setMimeData(mime_data)
+        drag.setPixmap(self._drag_pixmap)
+        drag.exec_(Qt.CopyAction)
+
     def mousePressEvent(self, event):
         """Handles the mouse press event."""
         if event.button() == Qt.LeftButton:
-            drag = QDrag(self)
-            mime_data = QMimeData()
-            mime_data.setText(self.species)
-            mime_data.setImageData(self.pixmap.toImage())
-            drag.setPixmap(self.pixmap.scaled(QSize(100, 100), Qt.KeepAspectRatio))
-            drag.setMimeData(mime_data)
-            drag.exec_(Qt.CopyAction)
-
-            if Species.selected is not None:
+            self._start_drag()
+
+            if Species.selected is not None and Species.selected is not self:
                 try:
-                    Species.selected.setStyleSheet("""
-                        QLabel {
-                            background-color: transparent;
-                        }
-                        QLabel::hover {
-                            background-color: transparent; 
-                            border: 2px solid black;
-                            border-radius: 4px;
-                        }
-                    """)
+                    if Species.selected.styleSheet() != Species._STYLE_IDLE:
+                        Species.selected.setStyleSheet(Species._STYLE_IDLE)
                 except RuntimeError:
                     pass
 
             Species.selected = self
-            self.setStyleSheet("""
-                QLabel {
-                    background-color: transparent; 
-                    border: 2px solid black;
-                    border-radius: 4px;
-                }
-            """)
+            if self.styleSheet() != Species._STYLE_SELECTED:
+                self.setStyleSheet(Species._STYLE_SELECTED)
 
             VARIABLE["selected"]["species"] = self.species
 
     def mouseMoveEvent(self, event):
         """Handles the mouse move event."""
         if event.buttons() == Qt.LeftButton:
-            drag = QDrag(self)
-            mime_data = QMimeData()
-            mime_data.setText(self.species)
-            mime_data.setImageData(self.pixmap.toImage())
-            drag.setMimeData(mime_data)
-            drag.setPixmap(self.pixmap.scaled(QSize(100, 100), Qt.KeepAspectRatio))
-            drag.exec_(Qt.CopyAction)
+            self._start_drag()
 
-            self.setStyleSheet("")
+            if self.styleSheet():
+                self.setStyleSheet("")
 
 
 class Populate(QWidget):
@@ -902,32 +1147,14 @@ class Populate(QWidget):
         _species = QGroupBox()
         self.species = QVBoxLayout()
         _species.setLayout(self.species)
-        herbivore = Species(QPixmap(VARIABLE["dir"] + "/Herbivore.png"), "Herbivore")
-        carnivore = Species(QPixmap(VARIABLE["dir"] + "/Carnivore.png"), "Carnivore")
+        herbivore = Species(_species_pixmap("Herbivore"), "Herbivore")
+        carnivore = Species(_species_pixmap("Carnivore"), "Carnivore")
         self.species.addWidget(carnivore)
         self.species.addWidget(herbivore)
         self.species.setAlignment(Qt.AlignHCenter)
 
-        herbivore.setStyleSheet("""
-            QLabel {
-                background-color: transparent;
-            }
-            QLabel::hover {
-                background-color: transparent; 
-                border: 2px solid black;
-                border-radius: 4px;
-            }
-        """)
-        carnivore.setStyleSheet("""
-            QLabel {
-                background-color: transparent;
-            }
-            QLabel::hover {
-                background-color: transparent; 
-                border: 2px solid black;
-                border-radius: 4px;
-            }
-        """)
+        herbivore.setStyleSheet(Species._STYLE_IDLE)
+        carnivore.setStyleSheet(Species._STYLE_IDLE)
 
         top.addWidget(_species)
 
@@ -935,7 +1162,7 @@ class Populate(QWidget):
         reset = QHBoxLayout()
         _reset = QPushButton()
         _reset.setFixedSize(200, 100)
-        _reset.setIcon(QIcon(VARIABLE["dir"] + "/delete.png"))
+        _reset.setIcon(_icon("delete"))
         _reset.setIconSize(QSize(100 // 3, 100 // 3))
         _reset.clicked.connect(self.reset)
         reset.addWidget(_reset)
@@ -973,11 +1200,11 @@ class Populate(QWidget):
         weight = None
         amount = VARIABLE["selected"]["amount"] if VARIABLE["selected"]["amount"] is not None else 1
 
+        # The animals are identical, and only read when added, so they can share one dictionary.
+        animal = {"species": species, "age": age, "weight": weight}
         animals = [{
             "loc": (int(i) + 1, int(j) + 1),
-            "pop": [{"species": species,
-                     "age": age,
-                     "weight": weight} for _ in range(amount)]}]
+            "pop": [animal] * amount}]
 
         VARIABLE["biosim"].add_population(animals)
 
@@ -985,13 +1212,18 @@ class Populate(QWidget):
         """Reset the population on the island."""
         VARIABLE["biosim"].island.slaughter()
 
-        for item in self.plot.scene.items():
-            if isinstance(item, QGraphicsPixmapItem):
-                self.plot.scene.removeItem(item)
+        self.plot.remove_animals()
 
 
 class Simulate(QWidget):
     """Class for simulating the population on the island."""
+    # Bounds for the plot update speed (the pause between updates is speed * 1e8 ms).
+    _SPEED_LIMITS = (1e-10, 1e-5)
+
+    # Minimum time between speed changes (seconds), and the time of the last change.
+    _SPEED_DEBOUNCE = 0.05
+    _last_speed_change = 0.0
+
     def __init__(self):
         super().__init__()
 
@@ -1053,9 +1285,13 @@ class Simulate(QWidget):
 
     def plot(self):
         """Plot the population on the island."""
+        import matplotlib.pyplot as plt
+        from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+
         self.fig = plt.Figure(figsize=(15, 10))
 
         self.canvas = FigureCanvas(self.fig)
+        self.canvas.setAttribute(Qt.WA_OpaquePaintEvent)
         self.layout().addWidget(self.canvas)
 
     def restart_years(self):
@@ -1065,7 +1301,7 @@ class Simulate(QWidget):
         VARIABLE["biosim"].reset_history()
 
         animals, n_species, n_species_cell = VARIABLE["biosim"].island.animals()
-        VARIABLE["biosim"].graphics.reset_counts()
+        VARIABLE["biosim"].graphics.reset_data(1)
         VARIABLE["biosim"].graphics.setup(1, n_species_cell, VARIABLE["speed"], self.fig)
         VARIABLE["biosim"].graphics.update_graphics(0,
                                                     n_species,
@@ -1083,7 +1319,7 @@ class Simulate(QWidget):
             If number of years to simulate has not been specified.
         """
         # years = int(self.years.value())
-        years = 1000
+        years = _SIMULATION_YEARS
         VARIABLE["biosim"].should_stop = False
 
         VARIABLE["biosim"].graphics.speed = VARIABLE["speed"]
@@ -1096,29 +1332,44 @@ class Simulate(QWidget):
         """Stops the simulation."""
         VARIABLE["biosim"].should_stop = True
 
+    @staticmethod
+    def _debounced():
+        """
+        Whether a speed change comes too soon after the previous one.
+
+        Returns
+        -------
+        bool
+        """
+        now = time.monotonic()
+        if now - Simulate._last_speed_change < Simulate._SPEED_DEBOUNCE:
+            return True
+        Simulate._last_speed_change = now
+        return False
+
     @staticmethod
     def faster():
         """Increase plot update speed."""
-        try:
-            VARIABLE["biosim"].graphics.speed /= 2
-            VARIABLE["speed"] = VARIABLE["biosim"].graphics.speed
-        except TypeError:
+        speed = VARIABLE["biosim"].graphics.speed if VARIABLE["biosim"] else None
+        if speed is None or Simulate._debounced():
             return
+        VARIABLE["biosim"].graphics.speed = max(speed / 2, Simulate._SPEED_LIMITS[0])
+        VARIABLE["speed"] = VARIABLE["biosim"].graphics.speed
 
     @staticmethod
     def slower():
         """Decrease plot update speed."""
-        try:
-            VARIABLE["biosim"].graphics.speed *= 2
-            VARIABLE["speed"] = VARIABLE["biosim"].graphics.speed
-        except TypeError:
+        speed = VARIABLE["biosim"].graphics.speed if VARIABLE["biosim"] else None
+        if speed is None or Simulate._debounced():
             return
+        VARIABLE["biosim"].graphics.speed = min(speed * 2, Simulate._SPEED_LIMITS[1])
+        VARIABLE["speed"] = VARIABLE["biosim"].graphics.speed
 
     def reset(self):
         """Reset the simulation."""
         VARIABLE["biosim"].island.year = 0
         animals, n_species, n_species_cell = VARIABLE["biosim"].island.animals()
-        VARIABLE["biosim"].graphics.reset_counts()
+        VARIABLE["biosim"].graphics.reset_data(1)
 
         VARIABLE["biosim"].graphics.setup(1, n_species_cell, VARIABLE["speed"], self.fig)
         VARIABLE["biosim"].graphics.update_graphics(0,
@@ -1128,22 +1379,227 @@ class Simulate(QWidget):
                                                     canvas=self.canvas)
 
 
+class _Downsampled(QObject):
+    """Signal carrying the job, and the history length and downsampled data from `_Downsample`."""
+    done = pyqtSignal(object, object)
+
+
+class _Downsample(QRunnable):
+    """
+    Downsamples the history series off the GUI thread.
+
+    Parameters
+    ----------
+    years : np.ndarray
+    series : list of np.ndarray
+        Copies of the history buffers, as the simulation may keep writing to them.
+    width : int
+        The number of points to downsample to.
+
+    Notes
+    -----
+    The job is deleted by the thread pool once `run` has returned, so the GUI thread may drop
+    its references to it as soon as the result arrives.
+    """
+    def __init__(self, years, series, width):
+        super().__init__()
+        self.setAutoDelete(True)
+
+        self.signals = _Downsampled()
+        self.years = years
+        self.series = series
+        self.width = width
+
+    def run(self):
+        """Downsample the series, and emit the result."""
+        self.signals.done.emit(self, (len(self.years), [_lttb(self.years, values, self.width)
+                                                        for values in self.series]))
+
+
 class History(QWidget):
-    """Class for visualising the history."""
+    """
+    Class for visualising the history.
+
+    Notes
+    -----
+    The axes and lines are created once, and only the line data is replaced when updating.
+    The lines are animated, meaning that they are blitted onto a cached background as long as
+    the axis limits are unchanged. Otherwise, the full figure is redrawn.
+    """
     def __init__(self):
         super().__init__()
 
         self.setGeometry(400, 200, 1000, 800)
         self.setLayout(QVBoxLayout())
 
+        import matplotlib.pyplot as plt
+        from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+
         self.fig = plt.Figure(figsize=(15, 10))
         self.fig.set_facecolor("#FBFAF5")
         self.canvas = FigureCanvas(self.fig)
+        self.canvas.setAttribute(Qt.WA_OpaquePaintEvent)
         self.layout().addWidget(self.canvas)
 
+        self._build_axes()
+
+        # Set when a redraw has been requested, and cleared once the canvas has drawn.
+        self._pending = False
+        self._background = None
+        self.canvas.mpl_connect('draw_event', self._drawn)
+
+        # Simulation state (see `_state`) at the last plot, used to skip identical replots.
+        self._rendered = None
+
+        # Iterations along the x-axis. Grown when needed, and sliced to the history length.
+        self._years = np.arange(1024)
+
+        # Downsampling jobs of long histories running in the thread pool (see `_Downsample`).
+        self._jobs = set()
+
+    def _build_axes(self):
+        """Create the axes, lines and legends. Executed once, the lines are updated in `plot`."""
+        self._lines = {}
+
+        self.old, self.thick, self.fit = self.fig.subplots(3, 1, sharex=True)
+
+        self.old.set_facecolor("#FBFAF5")
+        self.thick.set_facecolor("#FBFAF5")
+        self.fit.set_facecolor("#FBFAF5")
+
+        self.old.set_title("Gjennomsnittlig alder")
+        self.thick.set_title("Gjennomsnittlig vekt")
+        self.fit.set_title("Gjennomsnittlig form")
+
+        self.old_r = self.old.twinx()
+        self.thick_r = self.thick.twinx()
+
+        # The carnivore series are drawn on the twin axes when their magnitude differs from the
+        # herbivores', and otherwise on the shared lines of the primary axes (see `plot`).
+        lines = self._lines
+        lines["herb_age"], = self.old.plot([], [], label="Planteeter", color=_HERBIVORE_COLOUR)
+        lines["carn_age"], = self.old_r.plot([], [], label="Kjøtteter", color=_CARNIVORE_COLOUR)
+        lines["carn_age_shared"], = self.old.plot([], [], color=_CARNIVORE_COLOUR, visible=False)
+        self.old.set_ylabel("Planteeter alder")
+        self.old_r.set_ylabel("Kjøtteter alder")
+        self.old.add_artist(self.old.legend(handles=[lines["herb_age"]],
+                                            loc='upper left', bbox_to_anchor=(0, 1.2)))
+        self.old.legend(handles=[lines["carn_age"]], loc='upper right', bbox_to_anchor=(1, 1.2))
+        self.old.tick_params(axis="x", bottom=False, labelbottom=False)
+
+        lines["herb_weight"], = self.thick.plot([], [], label="Planteeter vekt",
+                                                color=_HERBIVORE_COLOUR)
+        lines["carn_weight"], = self.thick_r.plot([], [], label="Kjøtteter vekt",
+                                                  color=_CARNIVORE_COLOUR)
+        lines["carn_weight_shared"], = self.thick.plot([], [], color=_CARNIVORE_COLOUR,
+                                                       visible=False)
+        self.thick.set_ylabel("Planteeter vekt")
+        self.thick_r.set_ylabel("Kjøtteter vekt")
+        self.thick.tick_params(axis="x", bottom=False, labelbottom=False)
+
+        lines["herb_fitness"], = self.fit.plot([], [], color=_HERBIVORE_COLOUR)
+        lines["carn_fitness"], = self.fit.plot([], [], color=_CARNIVORE_COLOUR)
+        self.fit.set_xlabel("Iterasjon")
+
+        # The x-axis spans whole simulation runs, so it is only rescaled when a run starts.
+        self.fit.set_xlim(0, _SIMULATION_YEARS)
+
+        self._series = ((lines["herb_age"], "Herbivore", "Age"),
+                        (lines["carn_age"], "Carnivore", "Age"),
+                        (lines["carn_age_shared"], "Carnivore", "Age"),
+                        (lines["herb_weight"], "Herbivore", "Weight"),
+                        (lines["carn_weight"], "Carnivore", "Weight"),
+                        (lines["carn_weight_shared"], "Carnivore", "Weight"),
+                        (lines["herb_fitness"], "Herbivore", "Fitness"),
+                        (lines["carn_fitness"], "Carnivore", "Fitness"))
+        self._axes = (self.old, self.old_r, self.thick, self.thick_r, self.fit)
+        self._twins = ((self.old, self.old_r, lines["herb_age"], lines["carn_age"],
+                        lines["carn_age_shared"], ("Planteeter alder", "Alder")),
+                       (self.thick, self.thick_r, lines["herb_weight"], lines["carn_weight"],
+                        lines["carn_weight_shared"], ("Planteeter vekt", "Vekt")))
+        for line, _, _ in self._series:
+            line.set_animated(True)
+        for axis in self._axes:
+            axis.set_autoscalex_on(False)
+
+    def _drawn(self, _):
+        """
+        Executed when the canvas has been drawn (also on resize). Caches the background, and
+        replays updates skipped while the draw was pending.
+        """
+        if self._pending:
+            self._pending = False
+            # Deferred, so that the update is not run from within the draw.
+            QTimer.singleShot(0, self.update)
+        self._background = self.canvas.copy_from_bbox(self.fig.bbox)
+        self._draw_lines()
+
+    def _draw_lines(self):
+        """Draw the animated lines onto the canvas."""
+        for line, _, _ in self._series:
+            line.axes.draw_artist(line)
+
+    def _limits(self):
+        """
+        The current axis limits and visibilities.
+
+        Returns
+        -------
+        tuple
+        """
+        return tuple((axis.get_xlim(), axis.get_ylim(), axis.get_visible())
+                     for axis in self._axes)
+
+    @staticmethod
+    def _comparable(first, second):
+        """
+        Whether two series are of similar magnitude, i.e., their peaks are less than a factor
+        five apart. A series without (non-zero) values is comparable to any other.
+
+        Parameters
+        ----------
+        first : np.ndarray
+        second : np.ndarray
+
+        Returns
+        -------
+        bool
+        """
+        low, high = sorted(np.abs(series[np.isfinite(series)]).max(initial=0.0)
+                           for series in (np.asarray(first), np.asarray(second)))
+        return bool(low == 0 or high < 5 * low)
+
+    @staticmethod
+    def _state():
+        """
+        The state of the simulation the history depends on.
+
+        Returns
+        -------
+        tuple or None
+            The simulation's identity, year and history length. None if there is no simulation.
+        """
+        if not VARIABLE["biosim"]:
+            return None
+        return (id(VARIABLE["biosim"]),
+                VARIABLE["biosim"].island.year,
+                VARIABLE["biosim"].history["Herbivore"]["Age"]["n"])
+
+    def showEvent(self, event):
+        """Executed when the widget is shown. Updates the graphics, skipped while hidden."""
+        super().showEvent(event)
+        QTimer.singleShot(0, self.update)
+
     def update(self):
-        """Updates the graphics."""
-        self.fig.clear()
+        """
+        Updates the graphics, unless hidden, nothing has changed or a previous update is not
+        downsampled or drawn.
+        """
+        if not self.isVisible() or self._pending or self._jobs:
+            return
+        state = self._state()
+        if state is not None and state == self._rendered:
+            return
         self.plot()
 
     def plot(self):
@@ -1152,54 +1608,89 @@ class History(QWidget):
         if year is None:
             return
 
-        self.fig.clear()
         try:
-            years = [year for year in range(len(VARIABLE["biosim"].history["Herbivore"]["Age"]))]
+            history = VARIABLE["biosim"].history
+            n = history["Herbivore"]["Age"]["n"]
         except KeyError:
             return
 
-        old = self.fig.add_subplot(311)
-        thick = self.fig.add_subplot(312)
-        fit = self.fig.add_subplot(313)
+        if n == 0 and len(self._lines["herb_age"].get_xdata()) == 0:
+            # Nothing simulated, and nothing plotted that needs clearing.
+            return
 
-        old.set_facecolor("#FBFAF5")
-        thick.set_facecolor("#FBFAF5")
-        fit.set_facecolor("#FBFAF5")
+        if n > len(self._years):
+            self._years = np.arange(2 * n)
+        years = self._years[:n]
 
-        old.set_title("Gjennomsnittlig alder")
-        thick.set_title("Gjennomsnittlig vekt")
-        fit.set_title("Gjennomsnittlig form")
+        # Long histories are downsampled to roughly one point per pixel.
+        width = self.canvas.get_width_height()[0]
+        downsample = len(years) >= 2 * width
 
-        herbivore_age_axis = old
-        herbivore_age_axis.plot(years, VARIABLE["biosim"].history["Herbivore"]["Age"],
-                                label="Planteeter", color=(0.71764, 0.749, 0.63137))
+        self._rendered = self._state()
 
-        carnivore_age_axis = old.twinx()
-        carnivore_age_axis.plot(years, VARIABLE["biosim"].history["Carnivore"]["Age"],
-                                label="Kjøtteter", color=(0.949, 0.7647, 0.56078))
+        series = [history[species][feature]["buf"][:history[species][feature]["n"]]
+                  for _, species, feature in self._series]
+        if not downsample:
+            self._apply((n, [(years, values) for values in series]))
+            return
 
-        herbivore_age_axis.set_ylabel("Planteeter alder")
-        carnivore_age_axis.set_ylabel("Kjøtteter alder")
-        herbivore_age_axis.legend(loc='upper left', bbox_to_anchor=(0, 1.2))
-        carnivore_age_axis.legend(loc='upper right', bbox_to_anchor=(1, 1.2))
-        herbivore_age_axis.set_xticks([])
+        # The simulation keeps writing to the buffers, so the worker gets copies.
+        job = _Downsample(years, [values.copy() for values in series], width)
+        job.signals.done.connect(self._downsampled)
+        self._jobs.add(job)
+        QThreadPool.globalInstance().start(job)
 
-        herbivore_weight_axis = thick
-        herbivore_weight_axis.plot(years, VARIABLE["biosim"].history["Herbivore"]["Weight"],
-                                   label="Planteeter vekt", color=(0.71764, 0.749, 0.63137))
+    def _downsampled(self, job, result):
+        """
+        Executed on the GUI thread when a downsampling job has finished.
 
-        carnivore_weight_axis = thick.twinx()
-        carnivore_weight_axis.plot(years, VARIABLE["biosim"].history["Carnivore"]["Weight"],
-                                   label="Kjøtteter vekt", color=(0.949, 0.7647, 0.56078))
+        Parameters
+        ----------
+        job : _Downsample
+        result : tuple
+            See `_apply`.
+        """
+        self._jobs.discard(job)
+        self._apply(result)
+        # The history may have grown while downsampling.
+        self.update()
 
-        herbivore_weight_axis.set_ylabel("Planteeter vekt")
-        carnivore_weight_axis.set_ylabel("Kjøtteter vekt")
-        herbivore_weight_axis.set_xticks([])
+    def _apply(self, result):
+        """
+        Set the line data, and draw the lines. Executed on the GUI thread.
 
-        fit.plot(years, VARIABLE["biosim"].history["Herbivore"]["Fitness"],
-                 color=(0.71764, 0.749, 0.63137))
-        fit.plot(years, VARIABLE["biosim"].history["Carnivore"]["Fitness"],
-                 color=(0.949, 0.7647, 0.56078))
-        fit.set_xlabel("Iterasjon")
+        Parameters
+        ----------
+        result : tuple
+            The history length, and a list of the `(x, y)` data of each line in `self._series`.
+        """
+        n, data = result
+        limits = self._limits()
+        for (line, _, _), (xs, ys) in zip(self._series, data):
+            line.set_data(xs, ys)
+
+        # Similar magnitudes share one axis, so that the twin axis need not be drawn.
+        for primary, twin, herbivores, carnivores, shared, labels in self._twins:
+            together = self._comparable(herbivores.get_ydata(), carnivores.get_ydata())
+            twin.set_visible(not together)
+            carnivores.set_visible(not together)
+            shared.set_visible(together)
+            primary.set_ylabel(labels[together])
+
+        span = _SIMULATION_YEARS * max(1, math.ceil(n / _SIMULATION_YEARS))
+        if self.fit.get_xlim() != (0, span):
+            self.fit.set_xlim(0, span)
+        for axis in self._axes:
+            axis.relim(visible_only=True)
+            axis.autoscale_view(scalex=False)
+
+        if self._background is None or limits != self._limits():
+            # Ticks and labels have changed, so the background has to be redrawn.
+            self._pending = True
+            self.canvas.draw_idle()
+            return
 
-        self.canvas.draw()
+        self._pending = False
+        self.canvas.restore_region(self._background)
+        self._draw_lines()
+        self.canvas.blit(self.fig.bbox)
@@ -2,6 +2,7 @@
 
 
 import random
+import numpy as np
 import matplotlib.pyplot as plt
 
 from .graphics import Graphics
@@ -115,7 +116,8 @@ class BioSim:
         self.n_species_cell = None
         self.should_stop = False
 
-        self.history = {species: {"Age": [], "Weight": [], "Fitness": []}
+        self.history = {species: {feature: {"buf": np.empty(1024, dtype=np.float64), "n": 0}
+                                  for feature in ("Age", "Weight", "Fitness")}
                         for species in self.island.species_map}
 
     def set_animal_parameters(self, species, params):
@@ -232,7 +234,7 @@ class BioSim:
                     if history:
                         for species, _parameter in _history.items():
                             for parameter, value in _parameter.items():
-                                self.history[species][parameter].append(value)
+                                self._record(self.history[species][parameter], value)
                                 # self.history["n_species"] = self.n_species
             else:
                 if self.log_file:
@@ -257,10 +259,31 @@ class BioSim:
         """
         self.island.add_population(population)
 
+    @staticmethod
+    def _record(entry, value):
+        """
+        Append a value to a history entry, doubling its buffer when full.
+
+        Parameters
+        ----------
+        entry : dict
+
+            .. code:: python
+
+                {"buf": np.ndarray, "n": int}
+
+        value : float
+        """
+        if entry["n"] == len(entry["buf"]):
+            entry["buf"] = np.resize(entry["buf"], 2 * len(entry["buf"]))
+        entry["buf"][entry["n"]] = value
+        entry["n"] += 1
+
     def reset_history(self):
-        """Reset the history of the animals."""
-        self.history = {species: {"Age": [], "Weight": [], "Fitness": []}
-                        for species in self.island.species_map}
+        """Reset the history of the animals. The buffers are kept, only their lengths reset."""
+        for features in self.history.values():
+            for entry in features.values():
+                entry["n"] = 0
 
     def make_movie(self, movie_fmt="mp4"):
         """
@@ -0,0 +1,279 @@
+"""
+Tests for the gui module.
+"""
+
+
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtCore import QThreadPool
+import numpy as np
+from perlin_noise import PerlinNoise
+from src.biosim.gui import VARIABLE, BioSimGUI, Map, History, _WATER, _perlin, _lttb
+from src.biosim.simulation import BioSim
+import pytest
+
+
+# %% Fixtures:
+
+@pytest.fixture(scope="module")
+def application():
+    """
+    Creates the Qt application needed by the widgets.
+    """
+
+    # Setup:
+    application = QApplication.instance() or QApplication([])
+
+    yield application
+
+
+@pytest.fixture
+def water_island():
+    """
+    Sets the island to only water, restoring the previous island afterwards.
+    """
+
+    # Setup:
+    island = VARIABLE["island"]
+    VARIABLE["island"] = np.full((11, 11), _WATER, dtype=np.uint8)
+
+    yield VARIABLE["island"]
+
+    # Cleanup:
+    VARIABLE["island"] = island
+
+
+@pytest.fixture
+def simulation():
+    """
+    Sets the simulation to one without history, restoring the previous simulation afterwards.
+    """
+
+    # Setup:
+    previous = VARIABLE["biosim"]
+    VARIABLE["biosim"] = BioSim(island_map="WWW\nWLW\nWWW", ini_pop=[], vis_years=0)
+
+    yield VARIABLE["biosim"]
+
+    # Cleanup:
+    VARIABLE["biosim"] = previous
+
+
+@pytest.fixture
+def long_history(simulation):
+    """
+    Gives the simulation a history of 4500 iterations, long enough to be downsampled.
+    """
+
+    # Setup:
+    _simulate_history(simulation, 4500)
+
+    yield simulation
+
+
+def _simulate_history(simulation, years):
+    """
+    Appends the given number of years to the history of the simulation.
+    """
+
+    simulation.island.year += years
+    for features in simulation.history.values():
+        for entry in features.values():
+            for value in np.linspace(0, 1, years):
+                BioSim._record(entry, value)
+
+
+def _finish_jobs(application):
+    """
+    Waits for the downsampling jobs, and those started when their results arrive, to finish.
+    """
+
+    for _ in range(5):
+        QThreadPool.globalInstance().waitForDone()
+        application.processEvents()
+
+
+def _island(geography):
+    """
+    Creates an island array from a multi-line map string.
+    """
+
+    return np.array([list(row.encode()) for row in geography.split()], dtype=np.uint8)
+
+
+# %% Unit tests:
+
+@pytest.mark.parametrize("n, n_out", [[1000, 50], [101, 3], [5000, 977]])
+def test_lttb_keeps_endpoints_and_length(n, n_out):
+    """
+    Tests that downsampling keeps the first and last points, and returns `n_out` points of the
+    series in order.
+    """
+
+    x = np.arange(n, dtype=float)
+    y = np.sin(x / 7) * np.linspace(1, 3, n)
+    xs, ys = _lttb(x, y, n_out)
+
+    assert len(xs) == len(ys) == n_out, "Downsampled series has the wrong length."
+    assert (xs[0], ys[0], xs[-1], ys[-1]) == (x[0], y[0], x[-1], y[-1]), \
+        "Endpoints are not kept."
+    assert np.all(np.diff(xs) > 0) and np.array_equal(ys, y[xs.astype(int)]), \
+        "Downsampled points are not points of the series, in order."
+
+
+@pytest.mark.parametrize("n, n_out", [[10, 10], [10, 50], [0, 5]])
+def test_lttb_short_series_unchanged(n, n_out):
+    """
+    Tests that series no longer than `n_out` are returned unchanged.
+    """
+
+    x = np.arange(n, dtype=float)
+    y = x ** 2
+    xs, ys = _lttb(x, y, n_out)
+
+    assert xs is x and ys is y, "Short series is changed."
+
+
+@pytest.mark.parametrize("octaves", [1, 4, 7])
+def test_perlin_matches_perlin_noise(octaves):
+    """
+    Tests that the vectorised noise equals that of PerlinNoise, for a grid of coordinates.
+    """
+
+    noise = PerlinNoise(octaves=octaves, seed=1)
+    i, j = np.meshgrid(np.arange(1, 12), np.arange(1, 12), indexing="ij")
+    values = _perlin(noise, i / 12, j / 12)
+    expected = [[noise((x / 12, y / 12)) for y in range(1, 12)] for x in range(1, 12)]
+
+    assert np.allclose(values, expected, rtol=0, atol=1e-12), \
+        "Vectorised noise differs from PerlinNoise."
+
+
+@pytest.mark.parametrize("island, expected",
+                         [["WWWWW WWWWW WWWWW WWWWW WWWWW",
+                           "WWWWW WWWWW WWWWW WWWWW WWWWW"],
+                          ["WWWWW WWWWW WWWLW WWWWW WWWWW",
+                           "WWW WLW WWW"],
+                          ["LWWW WWWW WWWW WWWW",
+                           "LW WW"],
+                          ["WWWWWWW WWWWWWW WWWWWWW WWHLLMW WWWWWWW WWWWWWW",
+                           "WWWWWW WWWWWW WWWWWW WHLLMW WWWWWW WWWWWW"],
+                          ["WWWWWW WWWWWW WWWHWW WWWLWW WWWLWW WWWMWW WWWWWW",
+                           "WWWWWW WWHWWW WWLWWW WWLWWW WWMWWW WWWWWW"]])
+def test_shrink(island, expected):
+    """
+    Tests that the island is cropped to a single border of water, and then padded with water to a
+    square, starting at the top (or right).
+    """
+
+    assert np.array_equal(BioSimGUI.shrink(_island(island)), _island(expected)), \
+        "Island is not shrunk correctly."
+
+
+def test_shrink_returns_contiguous_copy():
+    """
+    Tests that shrinking an island to a square crop returns a contiguous copy, not a view.
+    """
+
+    island = np.full((9, 9), _WATER, dtype=np.uint8)
+    island[3:6, 3:6] = ord("L")
+    shrunk = BioSimGUI.shrink(island)
+
+    assert shrunk.shape == (5, 5), "Island is not shrunk correctly."
+    assert shrunk.flags.c_contiguous, "Shrunk island is not contiguous."
+    assert not np.shares_memory(shrunk, island), "Shrunk island is a view of the island."
+
+
+def test_rebuilt_map_renders_water(application, water_island):
+    """
+    Tests that a freshly rebuilt map of only water shows water, without waiting for a refresh.
+    """
+
+    plot = Map()
+    plot.rebuild()
+    image = plot.island.pixmap().toImage()
+    rows, cols = water_island.shape
+
+    assert (image.width(), image.height()) == (cols, rows), "Map is not rebuilt to the island."
+    assert all(image.pixel(i, j) == plot._lut[_WATER]
+               for j in range(rows) for i in range(cols)), "Rebuilt map does not show water."
+
+
+def test_resized_water_map_is_refitted(application, water_island):
+    """
+    Tests that resizing an island of only water schedules fitting it to the view.
+    """
+
+    plot = Map()
+    plot.show()
+    plot.update()
+    plot._refresh_timer.stop()
+
+    VARIABLE["island"] = np.pad(water_island, 1, constant_values=_WATER)
+    plot.update()
+
+    assert plot._refresh_timer.isActive(), "Resized map is not refitted to the view."
+
+
+def test_history_downsamples_long_history(application, long_history):
+    """
+    Tests that a long history is downsampled, keeping its endpoints, and that the job is released
+    once done.
+    """
+
+    history = History()
+    history.show()
+    history.update()
+    history.canvas.draw()
+    history.update()
+    _finish_jobs(application)
+
+    years = history._lines["herb_age"].get_xdata()
+    assert 2 < len(years) < 4500, "History is not downsampled."
+    assert (years[0], years[-1]) == (0, 4499), "Downsampled history does not span the history."
+    assert not history._jobs, "Downsampling job is not released when done."
+
+
+def test_history_update_while_downsampling(application, long_history):
+    """
+    Tests that the history is replotted if it grows while being downsampled.
+    """
+
+    history = History()
+    history.show()
+    history.update()
+    _finish_jobs(application)
+
+    # Grown twice within the same axis limits, so that the stale result is blitted without a
+    # redraw. The second update is requested while the first is downsampled.
+    for _ in range(2):
+        _simulate_history(long_history, 200)
+        history.update()
+    _finish_jobs(application)
+
+    assert history._lines["herb_age"].get_xdata()[-1] == 4899, \
+        "History is not replotted after growing while downsampling."
+
+
+def test_history_update_while_drawing(application, simulation):
+    """
+    Tests that the history is replotted if it grows while a redraw of the canvas is pending.
+    """
+
+    _simulate_history(simulation, 900)
+    history = History()
+    history.show()
+    _finish_jobs(application)
+
+    # The first growth widens the x-axis, so the canvas is redrawn. The second is requested
+    # before that redraw.
+    for years in (200, 100):
+        _simulate_history(simulation, years)
+        history.update()
+    _finish_jobs(application)
+
+    assert history._lines["herb_age"].get_xdata()[-1] == 1199, \
+        "History is not replotted after growing while drawing."
@@ -22,7 +22,7 @@ def trial_simulation():
                       {"loc": (2, 2), "pop": [{"species": "Carnivore",
                                                "age": 5,
                                                "weight": 20} for _ in range(40)]}]
-    sim = BioSim(island_map="WWWWW\nWLHDW\nWWWWW", ini_pop=sim_population, seed=1, vis_years=0)
+    sim = BioSim(island_map="WWWWW\nWLHMW\nWWWWW", ini_pop=sim_population, seed=1, vis_years=0)
 
     yield sim
 
@@ -34,7 +34,7 @@ def trial_simulation_empty():
     """
 
     # Setup:
-    sim = BioSim(island_map="WWWWW\nWLHDW\nWWWWW", ini_pop=[], seed=1, vis_years=0)
+    sim = BioSim(island_map="WWWWW\nWLHMW\nWWWWW", ini_pop=[], seed=1, vis_years=0)
 
     yield sim
 
@@ -152,6 +152,26 @@ def test_make_movie_wrong_format(trial_simulation):
         trial_simulation.make_movie("mp3")
 
 
+def test_history_buffer_growth(trial_simulation_empty):
+    """
+    Tests that the history buffers grow when full, and that resetting keeps the buffers.
+    """
+
+    entry = trial_simulation_empty.history["Herbivore"]["Age"]
+    size = len(entry["buf"])
+    for value in range(size + 1):
+        BioSim._record(entry, value)
+
+    assert entry["n"] == size + 1, "History length is not updated correctly."
+    assert len(entry["buf"]) == 2 * size, "History buffer is not grown correctly."
+    assert list(entry["buf"][:entry["n"]]) == list(range(size + 1)), \
+        "History values are not stored correctly."
+
+    buffer = entry["buf"]
+    trial_simulation_empty.reset_history()
+    assert entry["n"] == 0 and entry["buf"] is buffer, "History is not reset correctly."
+
+
 # %% Integration tests:
 
 @pytest.mark.parametrize("param, val",